@@ -5,8 +5,8 @@ This module is designed to allow a user to easily handle
 """
 
 from typing import Dict, Union, Tuple
-from copy import deepcopy
 from pathlib import Path
+from functools import lru_cache
 import warnings
 import numpy as np
 from astropy import units as u
@@ -20,6 +20,22 @@ from VSPEC.config import N_ZFILL, MOLEC_DATA_PATH
 from VSPEC import ObservationModel
 
 
+@lru_cache(maxsize=1)
+def _read_molec_data() -> dict:
+    """
+    Read the molecular data file.
+
+    The file never changes, so it is read once and cached.
+
+    Returns
+    -------
+    dict
+        The molecular data.
+    """
+    with open(MOLEC_DATA_PATH, 'rt', encoding='UTF-8') as file:
+        return json.loads(file.read())
+
+
 class PhaseAnalyzer:
     """Class to store and analyze `VSPEC` phase curves
 
@@ -56,43 +72,40 @@ class PhaseAnalyzer:
         """
         self.time = self._observation_data['time']
         self.phase = self._observation_data['phase']
-        self.unique_phase = deepcopy(self.phase)
-        for i in range(len(self.unique_phase) - 1):
-            while self.unique_phase[i] > self.unique_phase[i+1]:
-                self.unique_phase[i+1] += 360*u.deg
-        star = []
-        # star_facing_planet = pd.DataFrame() # not super interesting
-        reflected = []
-        thermal = []
-        total = []
-        noise = []
+        # Unwrap the phase so that it is monotonically increasing.
+        # Since each phase is on [0,360) deg, a wrap occurs exactly where
+        # the phase decreases, so the cumulative wrap count gives the
+        # number of full revolutions to add to each epoch.
+        phase_deg = self.phase.to_value(u.deg)
+        wraps = np.concatenate(([0], np.cumsum(np.diff(phase_deg) < 0)))
+        self.unique_phase = self.phase + wraps*360*u.deg
+        star = None
+        # star_facing_planet is not super interesting
+        reflected = None
+        thermal = None
+        total = None
+        noise = None
         for i in range(self.n_images):
             filename = path / f'phase{str(i).zfill(N_ZFILL)}.fits'
             spectra: QTable = QTable.read(filename)
             if i == 0:  # only do once
                 # wavelength
-                col = 'wavelength'
-                self.wavelength = spectra[col]
-            # star
-            col = 'star'
-            star.append((spectra[col]).to_value(fluxunit))
-            # reflected
-            col = 'reflected'
-            reflected.append((spectra[col]).to_value(fluxunit))
-            # reflected
-            col = 'planet_thermal'
-            thermal.append((spectra[col]).to_value(fluxunit))
-            # total
-            col = 'total'
-            total.append((spectra[col]).to_value(fluxunit))
-            # noise
-            col = 'noise'
-            noise.append((spectra[col]).to_value(fluxunit))
-        self.star = np.asarray(star).T * fluxunit
-        self.reflected = np.asarray(reflected).T * fluxunit
-        self.thermal = np.asarray(thermal).T * fluxunit
-        self.total = np.asarray(total).T * fluxunit
-        self.noise = np.asarray(noise).T * fluxunit
+                self.wavelength = spectra['wavelength']
+                # one contiguous backing buffer for all five data
+                # products; each name below is a view into it and rows
+                # are filled in place while reading.
+                data = np.empty((5, self.n_images, len(self.wavelength)))
+                star, reflected, thermal, total, noise = data
+            star[i] = (spectra['star']).to_value(fluxunit)
+            reflected[i] = (spectra['reflected']).to_value(fluxunit)
+            thermal[i] = (spectra['planet_thermal']).to_value(fluxunit)
+            total[i] = (spectra['total']).to_value(fluxunit)
+            noise[i] = (spectra['noise']).to_value(fluxunit)
+        self.star = u.Quantity(star.T, fluxunit, copy=False)
+        self.reflected = u.Quantity(reflected.T, fluxunit, copy=False)
+        self.thermal = u.Quantity(thermal.T, fluxunit, copy=False)
+        self.total = u.Quantity(total.T, fluxunit, copy=False)
+        self.noise = u.Quantity(noise.T, fluxunit, copy=False)
 
         try:
             first_lyr:QTable = PyLyr.from_fits(path / f'layer{str(0).zfill(N_ZFILL)}.fits').prof
@@ -141,18 +154,19 @@ class PhaseAnalyzer:
         """
         Get the mean molecular mass
         """
-        with open(MOLEC_DATA_PATH, 'rt',encoding='UTF-8') as file:
-            molec_data = json.loads(file.read())
+        molec_data = _read_molec_data()
         shape = self.get_layer('Alt').shape
-        mean_molec_mass = np.zeros(shape=shape)*u.g/u.mol
+        # Accumulate in a plain float array and attach the unit once at
+        # the end, rather than paying Quantity arithmetic per molecule.
+        mean_molec_mass = np.zeros(shape=shape)
         for mol, dat in molec_data.items():
             mass = dat['mass']
             try:
                 data = self.get_layer(mol)
-                mean_molec_mass += data*mass*u.g/u.mol
+                mean_molec_mass += data.to_value(u.dimensionless_unscaled)*mass
             except KeyError:
                 pass
-        return mean_molec_mass
+        return mean_molec_mass*u.g/u.mol
         
 
     def get_layer(self, var: str) -> u.Quantity:
@@ -184,9 +198,12 @@ class PhaseAnalyzer:
         tab: QTable = self.layers[var]
         cols = tab.colnames
         unit = tab[cols[0]].unit
-        return np.array(
+        # Quantity construction stacks the columns in a single copy;
+        # multiplying an np.array by `unit` would copy a second time.
+        return u.Quantity(
             [tab[col].to_value(unit) for col in cols],
-        )*unit
+            unit=unit
+        )
 
     def lightcurve(
         self,
@@ -437,7 +454,10 @@ class PhaseAnalyzer:
         wl = self.wavelength.to_value(wl_unit)
         flux = flux.to_value(flux_unit)
         noise = noise.to_value(flux_unit)
-        with open(outfile,'wt',encoding='ascii') as file:
-            for w,f,n in zip(wl,flux,noise):
-                file.write(f'{w:<10.4f}{f:<14.4e}{n:<14.4e}\n')
+        np.savetxt(
+            outfile,
+            np.column_stack((wl, flux, noise)),
+            fmt='%-10.4f%-14.4e%-14.4e',
+            encoding='ascii'
+        )
 
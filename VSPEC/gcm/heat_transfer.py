@@ -12,7 +12,6 @@ import numpy as np
 from scipy.integrate import solve_ivp, solve_bvp
 import warnings
 from copy import deepcopy
-from scipy.interpolate import interp1d
 
 from libpypsg.globes import PyGCM
 from libpypsg.globes import structure
@@ -268,6 +267,7 @@ class TemperatureMap:
         The fiducial temperature.
     """
     min_temp = 40*u.K
+    __slots__ = ('equator', 'epsilon', 't0')
 
     def __init__(
         self,
@@ -283,8 +283,15 @@ class TemperatureMap:
             mode = 'analytic'
 
         phi, temperature = get_equator_curve(epsilon, n_points, mode)
+        tsurf = temperature[:, 0]
 
-        self.equator = interp1d(phi, temperature[:, 0])
+        def equator(lon):
+            # Linear interpolation along the equator curve. This replaces
+            # a `scipy.interpolate.interp1d` (now legacy) with a single
+            # vectorized NumPy call.
+            return np.interp(lon, phi, tsurf)
+
+        self.equator = equator
         self.epsilon = epsilon
         self.t0 = t0
 
@@ -527,7 +534,9 @@ def to_pygcm(
     )
     lons = np.linspace(-np.pi, np.pi, shape[1], endpoint=False)
     lats = np.linspace(-np.pi/2, np.pi/2, shape[2], endpoint=True)
-    llons, llats = np.meshgrid(lons, lats, indexing='ij')
+    # a sparse grid broadcasts to the full map inside `eval` without
+    # materializing the (nlon, nlat) coordinate arrays
+    llons, llats = np.meshgrid(lons, lats, indexing='ij', sparse=True)
     dat = tmap.eval(llons, llats, lat_redistribution)
     balance_err = energy_balance_error(
         dat, lons, lats, star_teff, albedo, r_star, r_orbit
@@ -8,7 +8,6 @@ from astropy import units as u
 from scipy.optimize import newton
 from astropy.table import QTable
 
-import matplotlib.pyplot as plt
 
 class SystemGeometry:
     """System Geometry
@@ -93,6 +92,25 @@ class SystemGeometry:
     init_true_anomaly : astropy.units.quantity.Quantity [angle]
         True anomaly at the beginning of observation, computed from `init_time_since_periastron`.
     """
+    __slots__ = (
+        'inclination',
+        'init_stellar_lon',
+        'init_planet_phase',
+        'stellar_period',
+        'orbital_period',
+        'semimajor_axis',
+        'planetary_rot_period',
+        'planetary_init_substellar_lon',
+        'alpha',
+        'beta',
+        'eccentricity',
+        'phase_of_periastron',
+        'system_distance',
+        'obliquity',
+        'obliquity_direction',
+        'init_time_since_periastron',
+        'init_true_anomaly',
+    )
 
     def __init__(self, inclination=0*u.deg,
                  init_stellar_lon=0*u.deg,
@@ -189,10 +207,14 @@ class SystemGeometry:
         astropy.units.Quantity [angle]
             The eccentric anomaly.
         """
-        mean_anom = self.mean_anomaly(time)
+        # work in plain floats so each solver iteration skips the
+        # astropy unit machinery
+        mean_anom_rad = self.mean_anomaly(time).to_value(u.rad)
+        eccentricity = self.eccentricity
 
         def func(eccentric_anom: float):
-            return mean_anom.to_value(u.rad) - (eccentric_anom*u.deg).to_value(u.rad) + self.eccentricity*np.sin((eccentric_anom*u.deg).to_value(u.rad))
+            rad = np.deg2rad(eccentric_anom)
+            return mean_anom_rad - rad + eccentricity*np.sin(rad)
         eccentric_anom = newton(func, x0=30)*u.deg
         return eccentric_anom
 
@@ -219,18 +241,21 @@ class SystemGeometry:
             return eccentric_anomaly
         else:
             nu0 = 180*u.deg - (180*u.deg-eccentric_anomaly)*0.1
+            # the right-hand side is constant, and plain floats keep the
+            # unit machinery out of the solver iterations
+            eccentricity = self.eccentricity
+            rhs = (1+eccentricity) * \
+                np.tan(eccentric_anomaly.to_value(u.rad)/2)**2
 
             def func(nu):
-                eq = (1-self.eccentricity) * np.tan(nu*u.deg/2)**2 - \
-                    (1+self.eccentricity) * np.tan(eccentric_anomaly/2)**2
-                return eq
+                return (1-eccentricity) * np.tan(np.deg2rad(nu)/2)**2 - rhs
             nu = newton(func, x0=nu0.to_value(u.deg))*u.deg
             return nu
 
-    def phase(self, time):
+    def phase(self, time, true_anomaly=None):
         """
         Calculate the phase at a given time.
-        
+
         Phase is defined using the PSG convention.
         Transit occurs at phase=180 degrees.
 
@@ -238,13 +263,19 @@ class SystemGeometry:
         ----------
         time : astropy.units.Quantity [time]
             The time elapsed since periastron.
+        true_anomaly : astropy.units.Quantity [angle], default=None
+            The current true anomaly, if known. Otherwise it is calculated
+            based on `time`. It is best practice to specify `true_anomaly`
+            when possible to avoid using the Newtonian solver to calculate it.
 
         Returns
         -------
         astropy.units.Quantity [angle]
             The phase.
         """
-        return (self.true_anomaly(time) + self.phase_of_periastron) % (360*u.deg)
+        if true_anomaly is None:
+            true_anomaly = self.true_anomaly(time)
+        return (true_anomaly + self.phase_of_periastron) % (360*u.deg)
 
     def sub_planet(self, time, phase=None):
         """
@@ -293,11 +324,10 @@ class SystemGeometry:
         true_anomaly = phase - self.phase_of_periastron
         true_anomaly = true_anomaly % (360*u.deg)
         guess = true_anomaly/360/u.deg * self.orbital_period
+        true_anomaly_rad = true_anomaly.to_value(u.rad)
 
         def func(guess):
-            val = (self.true_anomaly(guess*u.day) -
-                   true_anomaly).to(u.rad).value
-            return val
+            return self.true_anomaly(guess*u.day).to_value(u.rad) - true_anomaly_rad
         time = newton(func, (guess/u.day).to(u.Unit(''))) * u.day
         return time.to(u.day)
 
@@ -312,12 +342,11 @@ class SystemGeometry:
         astropy.units.Quantity [angle]
             The sub-stellar longitude at periastron.
         """
-        init_time_since_periastron = self.get_time_since_periastron(
-            self.init_planet_phase)
-        init_deg_rotated = 360*u.deg * init_time_since_periastron/self.planetary_rot_period
+        init_deg_rotated = 360*u.deg * \
+            self.init_time_since_periastron/self.planetary_rot_period
         return self.planetary_init_substellar_lon + init_deg_rotated - self.init_true_anomaly
 
-    def get_substellar_lon(self, time_since_periastron) -> u.quantity.Quantity:
+    def get_substellar_lon(self, time_since_periastron, true_anomaly=None) -> u.quantity.Quantity:
         """
         Calculate the sub-stellar longitude at a particular time since periastron.
 
@@ -325,6 +354,11 @@ class SystemGeometry:
         ----------
         time_since_periastron : astropy.units.Quantity [time]
             The time elapsed since periastron.
+        true_anomaly : astropy.units.Quantity [angle], default=None
+            The current true anomaly, if known. Otherwise it is calculated
+            based on `time_since_periastron`. It is best practice to specify
+            `true_anomaly` when possible to avoid using the Newtonian solver
+            to calculate it.
 
         Returns
         -------
@@ -338,7 +372,8 @@ class SystemGeometry:
         """
         substellar_lon_at_periastron = self.get_substellar_lon_at_periastron()
         deg_rotated = 360*u.deg * time_since_periastron/self.planetary_rot_period
-        true_anom = self.true_anomaly(time_since_periastron)
+        true_anom = self.true_anomaly(
+            time_since_periastron) if true_anomaly is None else true_anomaly
         # how long since summer in N
         north_season = (true_anom - self.obliquity_direction) % (360*u.deg)
         if self.obliquity != 0*u.deg:
@@ -377,7 +412,7 @@ class SystemGeometry:
         lat = 0*u.deg + self.obliquity*np.cos(north_season)
         return lat
 
-    def get_pl_sub_obs_lon(self, time_since_periastron: u.quantity.Quantity, phase: u.quantity.Quantity) -> u.quantity.Quantity:
+    def get_pl_sub_obs_lon(self, time_since_periastron: u.quantity.Quantity, phase: u.quantity.Quantity, sub_stellar_lon: u.quantity.Quantity = None) -> u.quantity.Quantity:
         """
         Compute the sub-observer longitude of the planet.
 
@@ -387,13 +422,18 @@ class SystemGeometry:
             The time elapsed since periastron.
         phase : astropy.units.Quantity [angle]
             The current phase of the planet.
+        sub_stellar_lon : astropy.units.Quantity [angle], default=None
+            The current sub-stellar longitude, if known. Otherwise it is
+            calculated based on `time_since_periastron`.
 
         Returns
         -------
         astropy.units.Quantity [angle]
             The current sub-observer longitude of the planet.
         """
-        lon = self.get_substellar_lon(time_since_periastron) - phase
+        if sub_stellar_lon is None:
+            sub_stellar_lon = self.get_substellar_lon(time_since_periastron)
+        lon = sub_stellar_lon - phase
         return lon
 
     def get_pl_sub_obs_lat(self, phase: u.Quantity) -> u.Quantity:
@@ -473,7 +513,10 @@ class SystemGeometry:
         orbit_radii = []
         u_angle = u.deg
         for time in start_times + self.init_time_since_periastron:
-            phase = self.phase(time).to_value(u.deg)  # % (360*u.deg)
+            # Solve for the true anomaly once, then derive every
+            # other per-epoch quantity from it.
+            true_anom = self.true_anomaly(time)
+            phase = self.phase(time, true_anomaly=true_anom).to_value(u.deg)  # % (360*u.deg)
             phases.append(phase)
             sub_obs = self.sub_obs(time)
             sub_obs_lats.append(sub_obs['lat'].to_value(u_angle))
@@ -481,11 +524,13 @@ class SystemGeometry:
             sub_planet = self.sub_planet(time, phase=phase*u_angle)
             sub_planet_lats.append(sub_planet['lat'].to_value(u_angle))
             sub_planet_lons.append(sub_planet['lon'].to_value(u_angle))
-            sub_stellar_lon = self.get_substellar_lon(time)
+            sub_stellar_lon = self.get_substellar_lon(
+                time, true_anomaly=true_anom)
             sub_stellar_lat = self.get_substellar_lat(phase*u_angle)
             sub_stellar_lons.append(sub_stellar_lon.to_value(u_angle))
             sub_stellar_lats.append(sub_stellar_lat.to_value(u_angle))
-            pl_sub_obs_lon = self.get_pl_sub_obs_lon(time, phase*u_angle)
+            pl_sub_obs_lon = self.get_pl_sub_obs_lon(
+                time, phase*u_angle, sub_stellar_lon=sub_stellar_lon)
             pl_sub_obs_lat = self.get_pl_sub_obs_lat(phase*u_angle)
             pl_sub_obs_lons.append(pl_sub_obs_lon.to_value(u_angle))
             pl_sub_obs_lats.append(pl_sub_obs_lat.to_value(u_angle))
@@ -504,7 +549,7 @@ class SystemGeometry:
                 'orbit_radius': orbit_radii})
 
 
-    def get_system_visual(self,phase:u.Quantity,ax=None) -> plt.Axes:
+    def get_system_visual(self,phase:u.Quantity,ax=None):
         """
         Create a graphical representation of the host+planet geometry.
 
@@ -520,6 +565,8 @@ class SystemGeometry:
         matplotlib.axes.Axes
             The axis with the graphics drawn.
         """
+        # import lazily so the simulation never pays for matplotlib
+        import matplotlib.pyplot as plt
         if ax is None:
             ax = plt.gca()
         ax.set_aspect('equal', adjustable='box')
@@ -577,6 +624,7 @@ class SystemGeometry:
         matplotlib.axes.Axes
             The drawn figure.
         """
+        import matplotlib.pyplot as plt
         import cartopy.crs as ccrs
         from cartopy.geodesic import Geodesic
         if ax is None:
@@ -657,6 +705,7 @@ class SystemGeometry:
             A figure containing the plot.
         """
         # import cartopy. This way it is an optional dependencey
+        import matplotlib.pyplot as plt
         import cartopy.crs as ccrs
 
         fig = plt.figure()
@@ -17,7 +17,7 @@ def check_and_build_dir(path: Path) -> None:
         Path to check and create
     """
     if isinstance(path, str):
-        path = Path(str)
+        path = Path(path)
     if path.exists():
         pass
     else:
@@ -23,6 +23,7 @@ def get_planet_indicies(
     ----------
     planet_times : astropy.units.Quantity
         The times (cast to since periastron) at which the planet spectrum was taken.
+        Assumed to be sorted.
     tindex : astropy.units.Quantity
         The epoch of the current observation. The goal is to place this between
         two elements of `planet_times`
@@ -38,15 +39,19 @@ def get_planet_indicies(
     ------
     ValueError
         If multiple elements of 'planet_times' are equal to 'tindex'.
+    IndexError
+        If 'tindex' is after the last element of 'planet_times'.
     """
-    after = planet_times > tindex
-    equal = planet_times == tindex
-    if equal.sum() == 1:
-        N1 = np.argwhere(equal)[0][0]
-        N2 = np.argwhere(equal)[0][0]
-    elif equal.sum() > 1:
+    times = planet_times.value
+    time = tindex.to_value(planet_times.unit)
+    left = int(np.searchsorted(times, time, side='left'))
+    right = int(np.searchsorted(times, time, side='right'))
+    n_equal = right - left
+    if n_equal == 1:
+        return left, left
+    elif n_equal > 1:
         raise ValueError('There must be a duplicate time')
-    elif equal.sum() == 0:
-        N2 = np.argwhere(after)[0][0]
-        N1 = N2 - 1
-    return N1, N2
\ No newline at end of file
+    else:
+        if right == times.size:
+            raise IndexError('`tindex` is after the last element of `planet_times`')
+        return right - 1, right
\ No newline at end of file
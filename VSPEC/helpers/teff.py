@@ -49,4 +49,4 @@ def arrange_teff(minteff: u.Quantity, maxteff: u.Quantity):
     number_of_steps = ((high-low)/step).to_value(u.dimensionless_unscaled)
     number_of_steps = int(round(number_of_steps))
     teffs = low + np.arange(number_of_steps+1)*step
-    return np.array([int(round(teff.to_value(u.K))) for teff in teffs],dtype=int)
\ No newline at end of file
+    return np.round(teffs.to_value(u.K)).astype(int)
\ No newline at end of file
@@ -9,7 +9,7 @@ and PSG.
 from pathlib import Path
 import warnings
 import logging
-from functools import partial
+from functools import cached_property, partial
 from typing import Dict, Tuple
 
 import numpy as np
@@ -125,11 +125,14 @@ class ObservationModel:
         'psg_configs': 'PSGConfig'
     }
 
-    @property
+    @cached_property
     def directories(self) -> dict:
         """
         The directory structure for the VSPEC run.
 
+        This is computed once and cached, since ``self.params`` does not
+        change over the lifetime of the model.
+
         Returns
         -------
         dict
@@ -192,11 +195,14 @@ class ObservationModel:
         else:
             raise NotImplementedError(f'Unsure how to build ``GridSpectra`` object from {p}')
 
-    @property
+    @cached_property
     def _wl(self)->u.Quantity:
         """
         The wavelength axis of the observation.
 
+        The bandpass is fixed for the lifetime of the model, so the grid
+        is computed once and cached.
+
         Returns
         -------
         wl : astropy.units.Quantity
@@ -234,7 +240,7 @@ class ObservationModel:
             teffs = np.atleast_1d(teff.to_value(config.teff_unit))
             return self.spec.evaluate(
                 params=(teffs,),
-                wl=np.array(self._wl.to_value(config.wl_unit))
+                wl=self._wl.to_value(config.wl_unit)
             )[0, :] * config.flux_unit * self.params.flux_correction
         elif isinstance(self.params.header.spec_grid, BlackbodyGridParameters):
             return self.spec.evaluate(self._wl, teff) * self.params.flux_correction
@@ -302,6 +308,24 @@ class ObservationModel:
 
         return observation_parameters.get_observation_plan(start_times)
 
+    @cached_property
+    def _planet_observation_plan(self) -> QTable:
+        """
+        The observation plan for the planet epochs.
+
+        Solving the system geometry is expensive, and the plan is needed
+        by ``build_planet``, ``build_spectra``, and every interpolator
+        builder, so it is computed once and cached. This is safe because
+        ``self.params`` never changes.
+
+        Returns
+        -------
+        QTable
+            A table containing the planet observation plan.
+        """
+        return self._get_observation_plan(
+            self.get_observation_parameters(), planet=True)
+
     def _check_psg(self):
         """
         Check that PSG is configured correctly.
@@ -505,14 +529,19 @@ class ObservationModel:
 
         expected_cfg = self.params.to_pyconfig()
 
-        assert expected_cfg.target == cfg_from_psg.target, 'PSG target does not match'
-        assert expected_cfg.geometry == cfg_from_psg.geometry, 'PSG geometry does not match'
-        assert expected_cfg.atmosphere == cfg_from_psg.atmosphere, 'PSG atmosphere does not match'
-        assert expected_cfg.surface == cfg_from_psg.surface, 'PSG surface does not match'
-        assert expected_cfg.generator == cfg_from_psg.generator, 'PSG generator does not match'
-        assert expected_cfg.telescope == cfg_from_psg.telescope, 'PSG telescope does not match'
-        assert expected_cfg.noise == cfg_from_psg.noise, 'PSG noise does not match'
+        sections = (
+            'target',
+            'geometry',
+            'atmosphere',
+            'surface',
+            'generator',
+            'telescope',
+            'noise',
+        )
         # do not check the GCM
+        for section in sections:
+            if getattr(expected_cfg, section) != getattr(cfg_from_psg, section):
+                raise RuntimeError(f'PSG {section} does not match')
 
 
     def build_planet(self):
@@ -544,9 +573,7 @@ class ObservationModel:
 
         ####################################
         # Calculate observation parameters
-        observation_parameters = self.get_observation_parameters()
-        obs_plan = self._get_observation_plan(
-            observation_parameters, planet=True)
+        obs_plan = self._planet_observation_plan
 
         obs_info_filename = Path(
             self.directories['parent']) / 'observation_info.fits'
@@ -556,7 +583,7 @@ class ObservationModel:
             print(
                 f'Starting at phase {self.params.planet.init_phase}, observe for {self.params.obs.observation_time} in {self.params.planet_total_images} steps')
             print('Phases = ' +
-                  str(np.round(np.asarray((obs_plan['phase']/u.deg).to(u.Unit(''))), 2)) + ' deg')
+                  str(np.round(obs_plan['phase'].to_value(u.deg), 2)) + ' deg')
         ####################################
         # iterate through phases
         for i in self._wrap_iterator(range(self.params.planet_total_images+1), desc='Build Planet', total=self.params.planet_total_images+1):
@@ -705,26 +732,28 @@ class ObservationModel:
         )
         visible_flares = self.star.get_flare_int_over_timeperiod(
             tstart, tfinish, sub_obs_coords)
-        base_flux = self._get_model_spectrum(self.params.star.teff)
-        base_flux = base_flux * 0
+        # accumulate on plain float arrays, attaching the unit at the end
+        base_flux = np.zeros(self._wl.shape)
         # add up star flux before considering transit
         for teff, coverage in total.items():
             if coverage > 0:
-                flux = self._get_model_spectrum(u.Quantity(teff))
+                flux = self._get_model_spectrum(
+                    u.Quantity(teff)).to_value(config.flux_unit)
                 if not flux.shape == base_flux.shape:
                     raise ValueError('All arrays must have same shape.')
-                base_flux = base_flux + flux * coverage
+                base_flux += flux * coverage
         # get flux of transited region
-        transit_flux = base_flux*0
+        transit_flux = np.zeros_like(base_flux)
         for teff, coverage in covered.items():
             if coverage > 0:
-                flux = self._get_model_spectrum(u.Quantity(teff))
+                flux = self._get_model_spectrum(
+                    u.Quantity(teff)).to_value(config.flux_unit)
                 if not flux.shape == base_flux.shape:
                     raise ValueError('All arrays must have same shape.')
-                transit_flux = transit_flux + flux * coverage
+                transit_flux += flux * coverage
         # scale according to effective radius
-        transit_flux = transit_flux * transit_depth
-        base_flux = base_flux - transit_flux
+        transit_flux *= transit_depth
+        base_flux -= transit_flux
         # add in flares
         for flare in visible_flares:
             teff = flare['Teff']
@@ -732,10 +761,10 @@ class ObservationModel:
             eff_area = (timearea/(tfinish-tstart)).to(u.km**2)
             correction = (eff_area/self.params.system.distance **
                           2).to_value(u.dimensionless_unscaled)
-            flux = self.bb.evaluate(self._wl, teff) * correction
-            base_flux = base_flux + flux
+            base_flux += self.bb.evaluate(self._wl,
+                                          teff).to_value(config.flux_unit) * correction
 
-        return base_flux.to(config.flux_unit), pl_frac
+        return u.Quantity(base_flux, config.flux_unit, copy=False), pl_frac
 
     def _get_pyrad(
         self,
@@ -762,17 +791,16 @@ class ObservationModel:
         """
         Create an interpolaor from PSG outputs.
         """
-        observation_parameters = self.get_observation_parameters()
-        observation_info = self._get_observation_plan(
-            observation_parameters, planet=True)
-        times = observation_info['time'].to_value(config.time_unit)
-        spectra = [
-            self._get_pyrad(kind, i)[name].to_value(config.flux_unit) for i in range(self.params.planet_total_images+1)
-        ]
+        times = self._planet_observation_plan['time'].to_value(config.time_unit)
+        wl = self._wl.to_value(config.wl_unit)
+        n_images = self.params.planet_total_images+1
+        spectra = np.empty((n_images, wl.size))
+        for i in range(n_images):
+            spectra[i] = self._get_pyrad(kind, i)[name].to_value(config.flux_unit)
         return GridSpectra(
-            native_wl=self._wl.to_value(config.wl_unit),
+            native_wl=wl,
             params = {'time': times},
-            spectra = np.array(spectra),
+            spectra = spectra,
             impl='scipy'
         )
     
@@ -824,55 +852,52 @@ class ObservationModel:
         """
         Get an interpolator for the thermal spectra.
         """
-        observation_parameters = self.get_observation_parameters()
-        observation_info = self._get_observation_plan(
-            observation_parameters, planet=True)
-        times = observation_info['time'].to_value(config.time_unit)
-        spectra = []
-        for i in range(self.params.planet_total_images+1):
+        times = self._planet_observation_plan['time'].to_value(config.time_unit)
+        wl = self._wl.to_value(config.wl_unit)
+        n_images = self.params.planet_total_images+1
+        spectra = np.empty((n_images, wl.size))
+        for i in range(n_images):
             pyrad = self._get_pyrad('thermal', i)
             if 'Thermal' in pyrad.columns:
-                spectra.append(pyrad['Thermal'].to_value(config.flux_unit))
+                spectra[i] = pyrad['Thermal'].to_value(config.flux_unit)
             else:
                 if 'Transit' in pyrad.columns:
-                    spectra.append(
-                        (pyrad[self._thermal_name] - pyrad['Transit']).to_value(config.flux_unit)
-                    )
+                    spectra[i] = (
+                        pyrad[self._thermal_name] - pyrad['Transit']).to_value(config.flux_unit)
                 else:
-                    spectra.append(pyrad[self._thermal_name].to_value(config.flux_unit))
+                    spectra[i] = pyrad[self._thermal_name].to_value(config.flux_unit)
         return GridSpectra(
-            native_wl=self._wl.to_value(config.wl_unit),
+            native_wl=wl,
             params = {'time': times},
-            spectra = np.array(spectra),
+            spectra = spectra,
             impl='scipy'
         )
     def _get_reflected_interpolator(self)-> GridSpectra:
         """
         Get an interpolator for the reflected spectra.
         """
-        observation_parameters = self.get_observation_parameters()
-        observation_info = self._get_observation_plan(
-            observation_parameters, planet=True)
-        times = observation_info['time'].to_value(config.time_unit)
-        spectra = []
-        for i in range(self.params.planet_total_images+1):
+        times = self._planet_observation_plan['time'].to_value(config.time_unit)
+        wl = self._wl.to_value(config.wl_unit)
+        n_images = self.params.planet_total_images+1
+        spectra = np.empty((n_images, wl.size))
+        for i in range(n_images):
             combined = self._get_pyrad('combined', i)
             thermal = self._get_pyrad('thermal', i)
             if 'Reflected' in combined.columns:
-                spectra.append(combined['Reflected'].to_value(config.flux_unit))
+                spectra[i] = combined['Reflected'].to_value(config.flux_unit)
             else:
                 if 'Transit' in combined.columns:
                     cmb_spec = combined[self._thermal_name] - combined['Transit']
                     the_spec = thermal[self._thermal_name]
-                    spectra.append((cmb_spec - the_spec).to_value(config.flux_unit))
+                    spectra[i] = (cmb_spec - the_spec).to_value(config.flux_unit)
                 else:
                     cmb_spec = combined[self._thermal_name]
                     the_spec = thermal[self._thermal_name]
-                    spectra.append((cmb_spec - the_spec).to_value(config.flux_unit))
+                    spectra[i] = (cmb_spec - the_spec).to_value(config.flux_unit)
         return GridSpectra(
-            native_wl=self._wl.to_value(config.wl_unit),
+            native_wl=wl,
             params = {'time': times},
-            spectra = np.array(spectra),
+            spectra = spectra,
             impl='scipy'
         )
 
@@ -880,25 +905,21 @@ class ObservationModel:
         """
         Get an interpolator for the transit spectra.
         """
-        observation_parameters = self.get_observation_parameters()
-        observation_info = self._get_observation_plan(
-            observation_parameters, planet=True)
-        times = observation_info['time'].to_value(config.time_unit)
-        spectra = []
-        for i in range(self.params.planet_total_images+1):
+        times = self._planet_observation_plan['time'].to_value(config.time_unit)
+        wl = self._wl.to_value(config.wl_unit)
+        n_images = self.params.planet_total_images+1
+        spectra = np.empty((n_images, wl.size))
+        for i in range(n_images):
             try:
                 pyrad = self._get_pyrad('combined', i)
-                spectra.append(
-                    (-pyrad['Transit']/pyrad['Stellar']).to_value(u.dimensionless_unscaled)
-                )
+                spectra[i] = (-pyrad['Transit'] /
+                              pyrad['Stellar']).to_value(u.dimensionless_unscaled)
             except KeyError:
-                spectra.append(
-                    np.zeros_like(self._wl.value)
-                )
+                spectra[i] = 0.
         return GridSpectra(
-            native_wl=self._wl.to_value(config.wl_unit),
+            native_wl=wl,
             params = {'time': times},
-            spectra = np.array(spectra),
+            spectra = spectra,
             impl='scipy'
         )
         
@@ -999,7 +1020,7 @@ class ObservationModel:
                     + (background_noise)**2)
         return np.sqrt(noise_sq) * time_scale_factor
     
-    @property
+    @cached_property
     def _thermal_name(self):
         """
         The name of the thermal column in the output file.
@@ -1127,14 +1148,15 @@ class ObservationModel:
             self.directories['all_model']) / 'observation_info.fits'
         observation_info.write(obs_info_filename, overwrite=True)
 
-        planet_observation_info = self._get_observation_plan(
-            observation_parameters, planet=True)
+        planet_observation_info = self._planet_observation_plan
         planet_times = planet_observation_info['time']
         time_step = self.params.obs.integration_time
         planet_time_step = self.params.obs.observation_time / \
             (self.params.planet_total_images+1)
         granulation_fractions = self.star.get_granulation_coverage(
             observation_info['time'])
+        time_scale_factor = np.sqrt(
+            (planet_time_step/time_step).to_value(u.dimensionless_unscaled))
         print('Creating interpolators:', end='\n')
         s = 'thermal'
         print(s,end='\r')
@@ -1178,10 +1200,14 @@ class ObservationModel:
 
             sub_planet_lon = observation_info['sub_planet_lon'][index]
             sub_planet_lat = observation_info['sub_planet_lat'][index]
-            
+
+            # convert once for every interpolator call below
+            start_time = tstart.to_value(config.time_unit)
+            end_time = tfinish.to_value(config.time_unit)
+
             transit_depth = self._get_transit(
-                start_time=tstart.to_value(config.time_unit),
-                end_time=tfinish.to_value(config.time_unit),
+                start_time=start_time,
+                end_time=end_time,
                 transit_interpolator=interp_transit,
             )
 
@@ -1209,16 +1235,16 @@ class ObservationModel:
             )
 
             reflection_flux_adj = self._calculate_reflected_spectra(
-                start_time=tstart.to_value(config.time_unit),
-                end_time=tfinish.to_value(config.time_unit),
+                start_time=start_time,
+                end_time=end_time,
                 reflected_interpolator=interp_reflected,
                 stellar_interpolator=interp_stellar,
                 sub_planet_flux=to_planet_flux,
                 pl_frac=pl_frac
             )
             thermal_spectrum = self._get_thermal_spectrum(
-                start_time=tstart.to_value(config.time_unit),
-                end_time=tfinish.to_value(config.time_unit),
+                start_time=start_time,
+                end_time=end_time,
                 _interp_thermal=interp_thermal,
                 pl_frac=pl_frac
             )
@@ -1226,14 +1252,14 @@ class ObservationModel:
             combined_flux: u.Quantity = comp_flux + reflection_flux_adj + thermal_spectrum
             
             noise_flux_adj = self._calculate_noise(
-                start_time=tstart.to_value(config.time_unit),
-                end_time=tfinish.to_value(config.time_unit),
+                start_time=start_time,
+                end_time=end_time,
                 photon_noise_interpolator=interp_noise_photon,
                 detector_noise_interpolator=interp_noise_detector,
                 telescope_noise_interpolator=interp_noise_telescope,
                 background_noise_interpolator=interp_noise_background,
                 star_interpolator=interp_stellar,
-                time_scale_factor=np.sqrt((planet_time_step/time_step).to_value(u.dimensionless_unscaled)),
+                time_scale_factor=time_scale_factor,
                 cmb_flux=combined_flux
             )
 
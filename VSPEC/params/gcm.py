@@ -3,6 +3,7 @@ GCM parameters module
 """
 from typing import Callable
 from pathlib import Path
+from functools import lru_cache
 from astropy import units as u
 from netCDF4 import Dataset
 
@@ -22,6 +23,19 @@ def parse_molec_list(molec_list: list):
     return [mol if mol is not False else 'NO' for mol in molec_list]
 
 
+@lru_cache(maxsize=None)
+def _open_dataset(path: str) -> Dataset:
+    """
+    Open a netCDF dataset, keeping the handle for reuse.
+
+    A time-dependent GCM is read once per epoch. Reusing the open
+    handle skips the file-open metadata walk on each read and lets the
+    HDF5 chunk cache persist between epochs. The handle stays open for
+    the life of the process.
+    """
+    return Dataset(path)
+
+
 class gcmParameters(BaseParameters):
     """
     Class to store GCM parameters.
@@ -40,6 +54,8 @@ class gcmParameters(BaseParameters):
     _defaults = {
         'lat_redistribution': 0.0
     }
+    _gcm_types = frozenset(
+        {'binary', 'vspec', 'waccm', 'exocam', 'exoplasim'})
 
     def __init__(
         self,
@@ -47,9 +63,33 @@ class gcmParameters(BaseParameters):
         mean_molec_weight: float,
         is_static: bool
     ):
-        self.get_gcm = gcm_getter
+        self._gcm_getter = gcm_getter
         self.mean_molec_weight = mean_molec_weight
         self.is_staic = is_static
+        self._static_gcm = None
+
+    def get_gcm(self, *args, **kwargs) -> PyGCM:
+        """
+        Get the GCM.
+
+        A static GCM is identical for every epoch, so it is only
+        built on the first call and cached for reuse.
+
+        Parameters
+        ----------
+        obs_time : astropy.units.Quantity, optional
+            The time of the observation. Necessary for a time-dependent GCM.
+
+        Returns
+        -------
+        libpypsg.globes.PyGCM
+            The GCM.
+        """
+        if not self.is_staic:
+            return self._gcm_getter(*args, **kwargs)
+        if self._static_gcm is None:
+            self._static_gcm = self._gcm_getter()
+        return self._static_gcm
 
     def content(self, **kwargs):
         """
@@ -77,6 +117,9 @@ class gcmParameters(BaseParameters):
         gcm_dict = d['gcm']
         star_dict = d['star']
         planet_dict = d['planet']
+        if not cls._gcm_types & gcm_dict.keys():
+            raise KeyError(
+                f'None of {sorted(cls._gcm_types)} in {list(gcm_dict.keys())}')
         mean_molec_weight = float(gcm_dict['mean_molec_weight'])
         if 'binary' in gcm_dict:
             args_dict: dict = gcm_dict['binary']
@@ -123,31 +166,41 @@ class gcmParameters(BaseParameters):
             path = Path(args_dict['path']).expanduser()
             itime = int(args_dict['itime']) if 'itime' in args_dict else None
             is_static = itime is not None
+            # parse once here rather than on every getter call
+            molecules = parse_molec_list(args_dict['molecules'])
+            background = args_dict.get('background', None)
+            lon_start = args_dict.get('lon_start', -180)
+            lat_start = args_dict.get('lat_start', -90)
             if is_static:
+                aerosols = args_dict['aerosols']
+
                 def fun():
                     with Dataset(path) as data:
                         return waccm_to_pygcm(
                             data=data,
                             itime=itime,
-                            molecules=parse_molec_list(args_dict['molecules']),
-                            aerosols=args_dict['aerosols'],
-                            background=args_dict.get('background', None),
-                            lon_start=args_dict.get('lon_start', -180),
-                            lat_start=args_dict.get('lat_start', -90)
+                            molecules=molecules,
+                            aerosols=aerosols,
+                            background=background,
+                            lon_start=lon_start,
+                            lat_start=lat_start
                         )
             else:
+                aerosols = args_dict.get('aerosols', None)
+                tstart = u.Quantity(args_dict['tstart'])
+
                 def fun(obs_time: u.Quantity):
-                    with Dataset(path) as data:
-                        return waccm_to_pygcm(
-                            data=data,
-                            itime=waccm.get_time_index(
-                                data, obs_time + u.Quantity(args_dict['tstart'])),
-                            molecules=parse_molec_list(args_dict['molecules']),
-                            aerosols=args_dict.get('aerosols',None),
-                            background=args_dict.get('background', None),
-                            lon_start=args_dict.get('lon_start', -180),
-                            lat_start=args_dict.get('lat_start', -90)
-                        )
+                    data = _open_dataset(str(path))
+                    return waccm_to_pygcm(
+                        data=data,
+                        itime=waccm.get_time_index(
+                            data, obs_time + tstart),
+                        molecules=molecules,
+                        aerosols=aerosols,
+                        background=background,
+                        lon_start=lon_start,
+                        lat_start=lat_start
+                    )
             return cls(
                 gcm_getter=fun,
                 mean_molec_weight=mean_molec_weight,
@@ -158,32 +211,39 @@ class gcmParameters(BaseParameters):
             path = Path(args_dict['path']).expanduser()
             itime = int(args_dict['itime']) if 'itime' in args_dict else None
             is_static = itime is not None
+            # parse once here rather than on every getter call
+            molecules = parse_molec_list(args_dict['molecules'])
+            aerosols = args_dict['aerosols']
+            background = args_dict.get('background', None)
+            lon_start = args_dict.get('lon_start', -180)
+            lat_start = args_dict.get('lat_start', -90)
+            mean_molecular_mass = args_dict.get('mean_molecular_mass', None)
             if is_static:
                 def fun():
                     with Dataset(path) as data:
                         return exocam_to_pygcm(
                             data=data,
                             itime=itime,
-                            molecules=parse_molec_list(args_dict['molecules']),
-                            aerosols=args_dict['aerosols'],
-                            background=args_dict.get('background', None),
-                            lon_start=args_dict.get('lon_start', -180),
-                            lat_start=args_dict.get('lat_start', -90),
-                            mean_molecular_mass=args_dict.get('mean_molecular_mass',None)
+                            molecules=molecules,
+                            aerosols=aerosols,
+                            background=background,
+                            lon_start=lon_start,
+                            lat_start=lat_start,
+                            mean_molecular_mass=mean_molecular_mass
                         )
             else:
                 def fun(obs_time: u.Quantity):
-                    with Dataset(path) as data:
-                        return exocam_to_pygcm(
-                            data=data,
-                            itime=exocam.get_time_index(data, obs_time),
-                            molecules=parse_molec_list(args_dict['molecules']),
-                            aerosols=args_dict['aerosols'],
-                            background=args_dict.get('background', None),
-                            lon_start=args_dict.get('lon_start', -180),
-                            lat_start=args_dict.get('lat_start', -90),
-                            mean_molecular_mass=args_dict.get('mean_molecular_mass',None)
-                        )
+                    data = _open_dataset(str(path))
+                    return exocam_to_pygcm(
+                        data=data,
+                        itime=exocam.get_time_index(data, obs_time),
+                        molecules=molecules,
+                        aerosols=aerosols,
+                        background=background,
+                        lon_start=lon_start,
+                        lat_start=lat_start,
+                        mean_molecular_mass=mean_molecular_mass
+                    )
             return cls(
                 gcm_getter=fun,
                 mean_molec_weight=mean_molec_weight,
@@ -211,9 +271,9 @@ class gcmParameters(BaseParameters):
                 is_static=True
             )
 
-        else:
+        else:  # unreachable: caught by the membership check above
             raise KeyError(
-                f'`binary`, `waccm`, or `vspec` not in {list(d.keys())}')
+                f'None of {sorted(cls._gcm_types)} in {list(gcm_dict.keys())}')
 
 
 class psgParameters(BaseParameters):
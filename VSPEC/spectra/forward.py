@@ -14,6 +14,7 @@ class ForwardSpectra:
         The function that performs the evaluation of the spectra.
 
     """
+    __slots__ = ('evaluate',)
 
     def __init__(self, func):
         """
@@ -33,20 +34,31 @@ class ForwardSpectra:
 
         """
 
+        # Scalar SI values of the physical constants. Pulling these out
+        # once keeps the astropy unit machinery off the hot path: the
+        # Planck formula is evaluated on bare float arrays and the unit
+        # is attached exactly once at return.
+        # pylint: disable-next=no-member
+        h = c.h.si.value
+        # pylint: disable-next=no-member
+        c_light = c.c.si.value
+        # pylint: disable-next=no-member
+        k_b = c.k_B.si.value
+
         def func(wl: u.Quantity, teff: u.Quantity):
             """
             Evaluate the blackbody spectra at the given wavelength and temperature.
 
             Parameters
             ----------
-            wl : jax.numpy.ndarray
-                The array of wavelength values in micrometers.
-            teff : float
-                The temperature in Kelvin.
+            wl : astropy.units.Quantity
+                The array of wavelength values.
+            teff : astropy.units.Quantity
+                The effective temperature.
 
             Returns
             -------
-            np.ndarray
+            astropy.units.Quantity
                 The flux values of the blackbody spectra at the given wavelength and temperature.
 
             """
@@ -54,10 +66,10 @@ class ForwardSpectra:
                 raise u.UnitTypeError('wl is wrong physical type')
             if not teff.unit.physical_type == u.K.physical_type:
                 raise u.UnitTypeError('teff is wrong physical type')
-            # pylint: disable-next=no-member
-            A = 2 * c.h * c.c**2/wl**5
-            # pylint: disable-next=no-member
-            B = np.exp(((c.h*c.c)/(wl*c.k_B*teff)
-                        ).to(u.dimensionless_unscaled)) - 1
-            return (A/B).to(config.flux_unit)
+            wl_m = wl.to_value(u.m)
+            teff_k = teff.to_value(u.K)
+            amp = 2 * h * c_light**2 / wl_m**5
+            # expm1 is exact where exp(x)-1 loses precision at long wavelength
+            den = np.expm1(h*c_light/(wl_m*k_b*teff_k))
+            return ((amp/den) * u.Unit('W m-3')).to(config.flux_unit)
         return cls(func)
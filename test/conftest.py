@@ -23,10 +23,13 @@ def psg_url(request: pytest.FixtureRequest)->str:
     external = request.config.getoption('--external')
     return settings.PSG_URL if external else settings.INTERNAL_PSG_URL
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def test1_data(request: pytest.FixtureRequest) -> VSPEC.PhaseAnalyzer:
     """
     Run end-to-end test 1.
+
+    Reading every epoch back from disk is slow, so the analyzer is
+    built once and shared across the session. Tests must not mutate it.
     """
     path = Path(__file__).parent / 'end_to_end_tests' / 'test1' / 'test1.yaml'
     model = VSPEC.ObservationModel.from_yaml(path)
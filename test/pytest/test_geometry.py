@@ -94,10 +94,12 @@ def test_custon_init():
     assert geo.obliquity_direction == 30*u.deg
 
 
-def get_sub_obs_test(inclination: u.Quantity):
+@pytest.mark.parametrize('inclination', [0, 30, 45, 60, 90, 120, 135, 150, 180])
+def test_sub_obs_inclination(inclination: float):
     """
     Run tests for `SystemGeometry.sub_obs()` for a single inclination
     """
+    inclination = inclination*u.deg
     geo = SystemGeometry(inclination=inclination)
     time = 0*u.s
     init_lon = geo.init_stellar_lon
@@ -126,9 +128,6 @@ def test_sub_obs():
     """
     Run tests for `SystemGeometry.sub_obs()`
     """
-    for i in [0, 30, 45, 60, 90, 120, 135, 150, 180]*u.deg:
-        get_sub_obs_test(i)
-
     geo = SystemGeometry(stellar_offset_amp=90*u.deg,
                          stellar_offset_phase=0*u.deg, inclination=90*u.deg)
     time = 0*u.s
@@ -172,8 +171,10 @@ def test_mean_anomaly():
     """
     geo = SystemGeometry(init_planet_phase=0*u.deg,
                          phase_of_periastron=0*u.deg)
-    for time in np.linspace(0, 2, 11):
-        assert (geo.mean_anomaly(time*geo.orbital_period)).to_value(u.deg) == pytest.approx(360 * (time % 1), rel=1e-6)
+    time = np.linspace(0, 2, 11)
+    np.testing.assert_allclose(
+        geo.mean_anomaly(time*geo.orbital_period).to_value(u.deg),
+        360 * (time % 1), rtol=1e-6)
 
 
 def test_eccentric_anomaly():
@@ -238,15 +239,24 @@ def test_phase():
         true_anomaly = geo.true_anomaly(time*geo.orbital_period)
         assert phase.to_value(u.deg) == pytest.approx(
             true_anomaly.to_value(u.deg))
-    for init_planet_phase in np.linspace(0, 360, 4)*u.deg:
-        for phase_of_periastron in np.linspace(0, 360, 7)*u.deg:
-            geo = SystemGeometry(init_planet_phase=init_planet_phase,
-                                 phase_of_periastron=phase_of_periastron, eccentricity=0)
-            for time in np.linspace(0, 2, 11):
-                phase = geo.phase(time*geo.orbital_period)
-                true_anomaly = geo.true_anomaly(time*geo.orbital_period)
-                assert phase.to_value(u.deg) == pytest.approx(
-                    (true_anomaly+phase_of_periastron).to_value(u.deg) % 360, rel=1e-6)
+
+
+@pytest.mark.parametrize('init_planet_phase', np.linspace(0, 360, 4))
+@pytest.mark.parametrize('phase_of_periastron', np.linspace(0, 360, 7))
+def test_phase_of_periastron(init_planet_phase: float, phase_of_periastron: float):
+    """
+    Run tests for `SystemGeometry.phase()` with a nonzero
+    phase of periastron.
+    """
+    init_planet_phase = init_planet_phase*u.deg
+    phase_of_periastron = phase_of_periastron*u.deg
+    geo = SystemGeometry(init_planet_phase=init_planet_phase,
+                         phase_of_periastron=phase_of_periastron, eccentricity=0)
+    for time in np.linspace(0, 2, 11):
+        phase = geo.phase(time*geo.orbital_period)
+        true_anomaly = geo.true_anomaly(time*geo.orbital_period)
+        assert phase.to_value(u.deg) == pytest.approx(
+            (true_anomaly+phase_of_periastron).to_value(u.deg) % 360, rel=1e-6)
 
 
 def test_sub_planet():
@@ -380,10 +390,9 @@ def test_get_substellar_lat():
                          planetary_init_substellar_lon=0*u.deg,
                          orbital_period=10*u.day,
                          planetary_rot_period=10*u.day)
-    for phase in np.linspace(0, 360, 4)*u.deg:
-        lon = geo.get_substellar_lat(phase)
-        pred = 0*u.deg
-        assert compare_angles(lon, pred, abs=1e-6*u.deg)
+    phase = np.linspace(0, 360, 4)*u.deg
+    np.testing.assert_allclose(
+        geo.get_substellar_lat(phase).to_value(u.deg), 0, atol=1e-6)
     geo = SystemGeometry(obliquity=10*u.deg)
     with pytest.raises(NotImplementedError):
         geo.get_substellar_lat(0*u.deg)
@@ -434,20 +443,19 @@ def test_get_pl_sub_obs_lat():
     """
     Run tests for `SystemGeometry.get_pl_sub_obs_lat()`
     """
+    phase = np.linspace(0, 360, 4)*u.deg
+
     geo = SystemGeometry(inclination=90*u.deg)
-    for phase in np.linspace(0, 360, 4)*u.deg:
-        lat = geo.get_pl_sub_obs_lat(phase)
-        assert compare_angles(lat, 0*u.deg, 1e-6*u.deg)
+    np.testing.assert_allclose(
+        geo.get_pl_sub_obs_lat(phase).to_value(u.deg), 0, atol=1e-6)
 
     geo = SystemGeometry(inclination=0*u.deg)
-    for phase in np.linspace(0, 360, 4)*u.deg:
-        lat = geo.get_pl_sub_obs_lat(phase)
-        assert compare_angles(lat, -90*u.deg, 1e-6*u.deg)
+    np.testing.assert_allclose(
+        geo.get_pl_sub_obs_lat(phase).to_value(u.deg), -90, atol=1e-6)
 
     geo = SystemGeometry(inclination=180*u.deg)
-    for phase in np.linspace(0, 360, 4)*u.deg:
-        lat = geo.get_pl_sub_obs_lat(phase)
-        assert compare_angles(lat, 90*u.deg, 1e-6*u.deg)
+    np.testing.assert_allclose(
+        geo.get_pl_sub_obs_lat(phase).to_value(u.deg), 90, atol=1e-6)
     geo = SystemGeometry(inclination=0*u.deg, obliquity=10*u.deg)
     with pytest.raises(NotImplementedError):
         geo.get_pl_sub_obs_lat(0*u.deg)
@@ -458,8 +466,8 @@ def test_get_radius_coefficient():
     Run tests for `SystemGeometry.get_radius_coefficient()`
     """
     geo = SystemGeometry(eccentricity=0)
-    for phase in np.linspace(0, 360, 4)*u.deg:
-        assert geo.get_radius_coeff(phase) == pytest.approx(1, rel=1e-6)
+    phase = np.linspace(0, 360, 4)*u.deg
+    np.testing.assert_allclose(geo.get_radius_coeff(phase), 1, rtol=1e-6)
     geo = SystemGeometry(eccentricity=0.1, phase_of_periastron=0*u.deg)
     assert geo.get_radius_coeff(geo.phase_of_periastron) < geo.get_radius_coeff(
         geo.phase_of_periastron+180*u.deg)
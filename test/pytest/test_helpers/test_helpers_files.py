@@ -47,6 +47,19 @@ def test_path_does_not_exist(tmp_dir):
     assert tmp_dir.exists()
 
 
+def test_path_as_str(tmp_dir: Path):
+    """
+    Test that a string path is handled.
+
+    Test `VSPEC.files.check_and_build_dir()` function
+    with a path given as a `str`.
+    """
+    subdir = tmp_dir / 'subdir'
+    helpers.check_and_build_dir(str(subdir))
+    # check that the directory was created
+    assert subdir.exists()
+
+
 def test_get_filename():
     """
     Run tests for `VSPEC.files.get_filename()`
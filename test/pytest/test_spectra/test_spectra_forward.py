@@ -1,6 +1,6 @@
 
 import numpy as np
-from astropy import units as u
+from astropy import units as u, constants as c
 from VSPEC.spectra import ForwardSpectra
 
 
@@ -13,3 +13,11 @@ def test_forward_spectra_blackbody():
     # Assertions
     assert flux.shape == (3,)
     assert np.all(flux > 0)
+
+    # Compare to the Planck law evaluated with Quantity arithmetic.
+    # pylint: disable-next=no-member
+    amp = 2 * c.h * c.c**2/wl**5
+    # pylint: disable-next=no-member
+    den = np.exp(((c.h*c.c)/(wl*c.k_B*teff)).to(u.dimensionless_unscaled)) - 1
+    expected = (amp/den).to(u.Unit('W m-2 um-1'))
+    assert np.allclose(flux.to_value(u.Unit('W m-2 um-1')), expected.value)